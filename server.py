@@ -1,7 +1,14 @@
 import win32com.client
+import pythoncom
+import asyncio
+import functools
+import itertools
+import threading
 import uuid
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Union
 from mcp.server.fastmcp import FastMCP
 
@@ -18,24 +25,248 @@ E_INVALIDARG = 0x80070057      # One or more arguments are invalid
 E_ACCESSDENIED = 0x80070005      # Access denied
 DISP_E_MEMBERNOTFOUND = 0x80020003 # Member not found
 
+# Built once at import time - hr_to_string runs at least twice per tool
+# invocation, so rebuilding this map per call would be pure waste
+_HRESULT_MAP = {
+    S_OK: "S_OK (0x00000000) - Operation successful",
+    S_FALSE: "S_FALSE (0x00000001) - Successful but false condition",
+    E_FAIL: "E_FAIL (0x80004005) - Unspecified failure",
+    E_NOINTERFACE: "E_NOINTERFACE (0x80004002) - Interface not supported",
+    E_INVALIDARG: "E_INVALIDARG (0x80070057) - One or more arguments are invalid",
+    E_ACCESSDENIED: "E_ACCESSDENIED (0x80070005) - Access denied",
+    DISP_E_MEMBERNOTFOUND: "DISP_E_MEMBERNOTFOUND  (0x80020003) - Member not found"
+}
+
 def hr_to_string(hr: int) -> str:
     """Convert HRESULT code to a readable string."""
-    hresult_map = {
-        S_OK: "S_OK (0x00000000) - Operation successful",
-        S_FALSE: "S_FALSE (0x00000001) - Successful but false condition",
-        E_FAIL: "E_FAIL (0x80004005) - Unspecified failure",
-        E_NOINTERFACE: "E_NOINTERFACE (0x80004002) - Interface not supported",
-        E_INVALIDARG: "E_INVALIDARG (0x80070057) - One or more arguments are invalid",
-        E_ACCESSDENIED: "E_ACCESSDENIED (0x80070005) - Access denied",
-        DISP_E_MEMBERNOTFOUND: "DISP_E_MEMBERNOTFOUND  (0x80020003) - Member not found"
-    }
-    return hresult_map.get(hr, f"Unknown HRESULT: {hex(hr)}")
+    # Only format the fallback when the code is actually unknown
+    text = _HRESULT_MAP.get(hr)
+    return text if text is not None else f"Unknown HRESULT: {hex(hr)}"
+
+# Precomputed message prefixes for the common response paths. The HRESULT
+# portion of each message is constant per code path, so the hot path only
+# concatenates the variable suffix instead of re-running hr_to_string and
+# parsing an f-string on every response.
+_MSG_ACCESS_DENIED = _HRESULT_MAP[E_ACCESSDENIED] + ": "
+_MSG_INVALID_ID = _HRESULT_MAP[E_INVALIDARG] + ": Invalid object ID: "
+_MSG_METHOD_NOT_FOUND = _HRESULT_MAP[DISP_E_MEMBERNOTFOUND] + ": Method not found: "
+_MSG_PROPERTY_NOT_FOUND = _HRESULT_MAP[DISP_E_MEMBERNOTFOUND] + ": Property not found: "
+_MSG_OK_CREATE = _HRESULT_MAP[S_OK] + ": Successfully created COM object: "
+_MSG_OK_QUERY = _HRESULT_MAP[S_OK] + ": Successfully queried interface: "
+_MSG_OK_TYPE_INFO = _HRESULT_MAP[S_OK] + ": Successfully retrieved type information"
+_MSG_OK_INVOKE = _HRESULT_MAP[S_OK] + ": Successfully invoked method: "
+_MSG_OK_GET_PROPERTY = _HRESULT_MAP[S_OK] + ": Successfully got property: "
+_MSG_OK_SET_PROPERTY = _HRESULT_MAP[S_OK] + ": Successfully set property: "
+_MSG_OK_DISPOSE = _HRESULT_MAP[S_OK] + ": Successfully disposed object"
 
 # Initialize the MCP server
 mcp = FastMCP("mcp-com-server", version="1.0", description="MCP COM Server for Agents")
 
+@dataclass(slots=True)
+class _RegistryEntry:
+    """Registry slot for one live COM object. Slotted to keep per-entry
+    memory small - a session can accumulate hundreds of child proxies."""
+    obj: Any
+    prog_id: Any
+    clsid: Any
+    type_info: Optional[Dict[str, Any]] = None
+
 # Object registry to track all created COM objects - storing both objects and their ProgIDs
-object_registry: Dict[str, Dict[str, Any]] = {}
+object_registry: Dict[str, _RegistryEntry] = {}
+
+# Guards registry mutations in case FastMCP dispatches tool calls
+# concurrently; plain reads are already atomic under the GIL, so only
+# inserts and removals take the lock
+_registry_lock = threading.Lock()
+
+# Registry version, bumped (under the lock) on every insert or removal so
+# read-side caches can be invalidated with a single integer compare
+_reg_version = 0
+
+# Cached ListActiveComObjects response and the registry version it reflects
+_list_cache: tuple = (None, -1)
+
+# Pooling for heavyweight application objects. CoCreateInstance on an
+# out-of-process server like Excel launches a whole process, so instead of
+# releasing such objects on dispose, park them for the next CreateObject of
+# the same ProgID. Reset semantics are app-specific, so only ProgIDs with a
+# registered reset routine participate.
+
+def _reset_excel(app: Any) -> None:
+    # Close all open workbooks so the pooled instance comes back clean
+    app.Workbooks.Close()
+
+_POOL_RESETTERS = {
+    "Excel.Application": _reset_excel,
+}
+
+# ProgIDs eligible for pooling (derived from the registered reset routines)
+POOL_PROGIDS = frozenset(_POOL_RESETTERS)
+
+_dispatch_pool: Dict[str, List[Any]] = {}
+_pool_lock = threading.Lock()
+
+# Keep at most this many idle instances per ProgID
+_POOL_MAX_PER_PROGID = 4
+
+def _pooled_dispatch(identifier: str) -> Any:
+    """Return a live pooled instance for the identifier, or create a fresh one."""
+    while True:
+        with _pool_lock:
+            pool = _dispatch_pool.get(identifier)
+            if not pool:
+                break
+            candidate = pool.pop()
+
+        # A parked instance can die while idle (e.g. the user closes the
+        # pooled Excel process), so touch it before handing it out and fall
+        # back to the next parked instance - or a fresh Dispatch - if the
+        # call fails
+        try:
+            candidate._oleobj_.GetTypeInfoCount()
+        except Exception as e:
+            logger.debug("Dropping dead pooled instance of %s: %s", identifier, e)
+            continue
+        return candidate
+
+    return win32com.client.Dispatch(identifier)
+
+def _maybe_pool_object(entry: _RegistryEntry) -> None:
+    """
+    Park a disposed application object in the dispatch pool if its ProgID has
+    a reset routine and the pool has room; otherwise let it be released.
+    """
+    reset = _POOL_RESETTERS.get(entry.prog_id)
+    if reset is None:
+        return
+
+    pool = _dispatch_pool.setdefault(entry.prog_id, [])
+    if len(pool) >= _POOL_MAX_PER_PROGID:
+        return
+
+    try:
+        # Reset outside the lock - it's a COM round-trip and may be slow
+        reset(entry.obj)
+    except Exception as e:
+        # If the instance can't be reset, drop it and let GC release it
+        logger.debug("Failed to reset pooled object: %s", e)
+        return
+
+    with _pool_lock:
+        if len(pool) < _POOL_MAX_PER_PROGID:
+            pool.append(entry.obj)
+
+# All COM calls run on one dedicated thread. COM objects are bound to the
+# apartment they were created in, so funneling every call through the same
+# thread (initialized once with CoInitializeEx) avoids cross-apartment proxy
+# marshaling - and the stdio event loop stays free to service other requests
+# while a slow Dispatch or method call blocks.
+_com_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="com",
+    initializer=pythoncom.CoInitializeEx,
+    initargs=(pythoncom.COINIT_MULTITHREADED,)
+)
+
+async def _run_on_com_thread(fn, *args):
+    """Run a blocking COM operation on the dedicated COM thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_com_executor, functools.partial(fn, *args))
+
+def _shutdown_com_executor() -> None:
+    """Balance the executor's CoInitializeEx on the thread that ran it."""
+    # CoUninitialize must run on the thread that initialized COM. Called
+    # from __main__ when the server stops - an atexit hook would fire too
+    # late, after concurrent.futures has already shut the executor down.
+    try:
+        _com_executor.submit(pythoncom.CoUninitialize).result(timeout=5)
+    except Exception as e:
+        logger.warning("Failed to uninitialize COM at shutdown: %s", e)
+    _com_executor.shutdown(wait=False)
+
+# Sentinel distinguishing "not registered" from a stored None in dict.pop
+_MISSING = object()
+
+# Batches above this size report invalid IDs as one summary entry
+_DISPOSE_SUMMARY_THRESHOLD = 32
+
+# Monotonic runtime ID generator - short sequential IDs ("r1", "r2", ...) are cheaper
+# to generate and hash than UUID strings, and runtime IDs only need to be unique
+# within this server process
+_id_gen = itertools.count(1)
+
+def _new_runtime_id() -> str:
+    """Generate the next runtime ID for the object registry."""
+    return f"r{next(_id_gen)}"
+
+# Base classes of win32com proxy objects, resolved once at import time
+_COM_BASES = (win32com.client.CDispatch,
+              win32com.client.CoClassBaseClass,
+              win32com.client.DispatchBaseClass)
+
+def _is_com_object(value: Any, oleobj: Any) -> bool:
+    """
+    Check whether a value returned from a COM call is itself a COM object.
+    Callers pass the value's _oleobj_ (fetched once with getattr) so the
+    check doesn't repeat the attribute probe - on a COM object every probe
+    is a full IDispatch name lookup. The _oleobj_ test catches PyIDispatch
+    wrappers that don't derive from the win32com proxy base classes.
+    """
+    return value is not None and (oleobj is not None or
+                                  isinstance(value, _COM_BASES))
+
+# ProgID<->CLSID resolution goes through the Windows registry, and the same
+# conversion repeats for every child object of the same class (e.g. iterating
+# Worksheets), so memoize both directions. Failures are cached as "Unknown"
+# to avoid re-hitting the registry for unresolvable identifiers.
+
+@functools.lru_cache(maxsize=1024)
+def _progid_from_clsid(clsid: str) -> str:
+    """Resolve a CLSID to its ProgID, returning "Unknown" on failure."""
+    try:
+        return win32com.client.ProgIDFromCLSID(clsid)
+    except Exception:
+        return "Unknown"
+
+@functools.lru_cache(maxsize=1024)
+def _clsid_from_progid(prog_id: str) -> Any:
+    """Resolve a ProgID to its CLSID, returning "Unknown" on failure."""
+    try:
+        return win32com.client.GetCLSIDFromProgID(prog_id)
+    except Exception:
+        return "Unknown"
+
+@functools.lru_cache(maxsize=1024)
+def _uuid_from_bytes_le(clsid_bytes: bytes) -> str:
+    """Convert little-endian CLSID bytes (as returned by GetCLSID) to a UUID string."""
+    return str(uuid.UUID(bytes_le=clsid_bytes))
+
+def _register_com_object(obj: Any, oleobj: Any = None) -> str:
+    """
+    Register a COM object (a queried interface, method return value or
+    property value) in the object registry and return its new runtime ID.
+    Callers that already fetched the object's _oleobj_ pass it along to
+    avoid a second attribute probe.
+    """
+    new_runtime_id = _new_runtime_id()
+    clsid = "Unknown"
+    prog_id = "Unknown"
+
+    # Try to get CLSID if possible (for informational purposes)
+    if oleobj is None:
+        oleobj = getattr(obj, "_oleobj_", None)
+    if oleobj is not None:
+        try:
+            clsid = _uuid_from_bytes_le(oleobj.GetCLSID())
+            prog_id = _progid_from_clsid(clsid)
+        except Exception as e:
+            logger.debug("Failed to get CLSID: %s", e)
+
+    global _reg_version
+    with _registry_lock:
+        object_registry[new_runtime_id] = _RegistryEntry(obj, prog_id, clsid)
+        _reg_version += 1
+    return new_runtime_id
 
 # ALLOWLIST for COM objects (empty means all allowed)
 COM_ALLOWLIST = []
@@ -47,24 +278,81 @@ def is_com_object_allowed(identifier: str) -> bool:
         return True
     return identifier in COM_ALLOWLIST
 
+def _get_type_info_early_bound(cls: type, pm_get: Dict[str, Any],
+                               pm_put: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build type information for an early-bound gen_py proxy from the member
+    maps makepy already generated, without touching the live COM object.
+    """
+    methods: List[Dict[str, Any]] = []
+    seen = set()
+
+    # Generated methods are plain functions on the proxy class hierarchy,
+    # so enumerating them never crosses the COM boundary
+    for klass in cls.__mro__:
+        for name, attr in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if callable(attr):
+                signature = getattr(attr, "__signature__", None)
+                methods.append({
+                    "name": name,
+                    "is_private": name.startswith("_"),
+                    "signature": str(signature) if signature is not None else "Unknown"
+                })
+
+    properties: List[Dict[str, Any]] = []
+    events: List[str] = []
+    for name in sorted(pm_get.keys() | pm_put.keys()):
+        if name.startswith("on") and name[2:3].isupper():
+            # Heuristic for identifying potential event handlers
+            events.append(name)
+        else:
+            properties.append({
+                "name": name,
+                # The generated maps carry DISPIDs, not value types; probing
+                # the live object per property is exactly what this path avoids
+                "type": "Unknown",
+                "is_private": name.startswith("_"),
+                "is_com_object": False
+            })
+
+    return {
+        "methods": methods,
+        "properties": properties,
+        "events": events,
+        "errors_encountered": []
+    }
+
 def get_type_info(obj) -> Dict[str, Any]:
     """
     Get extended type information about a COM object.
     This function attempts to discover available methods and properties of a COM object
     through introspection, providing additional metadata where possible.
-    
+
     Args:
         obj: COM object to inspect
-        
+
     Returns:
         Dictionary containing categorized methods and properties with metadata
     """
-    type_info = {
-        "methods": [],
-        "properties": [],
-        "events": [],
-        "errors_encountered": []
-    }
+    # Early-bound gen_py proxies declare their members statically in the
+    # generated class, so read those maps directly - a couple of dict
+    # iterations instead of a getattr through COM for every member. Only
+    # pure late-bound Dispatch falls through to the attribute walk below.
+    cls = type(obj)
+    pm_get = getattr(cls, "_prop_map_get_", None)
+    pm_put = getattr(cls, "_prop_map_put_", None)
+    if isinstance(pm_get, dict) and isinstance(pm_put, dict):
+        return _get_type_info_early_bound(cls, pm_get, pm_put)
+
+    # Local bindings keep the per-member loop below on fast LOAD_FAST
+    # lookups instead of repeated dict indexing
+    methods: List[Dict[str, Any]] = []
+    properties: List[Dict[str, Any]] = []
+    events: List[str] = []
+    errors_encountered: List[Dict[str, str]] = []
 
     # Include both public and private members (COM objects often expose important
     # functionality through "_" prefixed members)
@@ -73,28 +361,30 @@ def get_type_info(obj) -> Dict[str, Any]:
             # For COM objects, accessing some attributes might raise exceptions
             # even during simple inspection
             attr = getattr(obj, name)
-            
+
             # Try to determine if it's a method or property
             if callable(attr):
-                type_info["methods"].append({
+                # Try to get signature if available - only stringify when one
+                # actually exists rather than str()-ing the default
+                signature = getattr(attr, "__signature__", None)
+                methods.append({
                     "name": name,
                     "is_private": name.startswith("_"),
-                    # Try to get signature if available
-                    "signature": str(getattr(attr, "__signature__", "Unknown"))
+                    "signature": str(signature) if signature is not None else "Unknown"
                 })
             else:
                 # It's a property
                 if name.startswith("on") and name[2:3].isupper():
                     # Heuristic for identifying potential event handlers
-                    type_info["events"].append(name)
+                    events.append(name)
                 else:
                     property_type = "Unknown"
                     try:
                         property_type = type(attr).__name__
                     except:
                         pass
-                        
-                    type_info["properties"].append({
+
+                    properties.append({
                         "name": name,
                         "type": property_type,
                         "is_private": name.startswith("_"),
@@ -102,37 +392,36 @@ def get_type_info(obj) -> Dict[str, Any]:
                     })
         except Exception as e:
             # Log specific errors without breaking the entire inspection
-            type_info["errors_encountered"].append({
+            errors_encountered.append({
                 "member": name,
                 "error": str(e)
             })
-            
-    return type_info
 
-@mcp.tool("CreateObject")
-def co_create_instance(identifier: str) -> Dict[str, Any]:
-    """
-    This tool can be used to leverage Windows COM Automation to use Office applications, spreadsheets, 
-    emails, and anything else that is based on COM. It uses the win32com.client (python wrapper) module 
-    to create COM objects via a CLSID or ProgID (CoCreateInstance). 
-    The tool returns a unique runtime_id for the created object, which can be used to interact with it. 
-    For properties that are objects, a new runtime_id object is returned that you can use to interact. 
-    The same happens if an InvokeMethod returns a COM object, you can use the new runtime_id to interact with it.
-    """
+    return {
+        "methods": methods,
+        "properties": properties,
+        "events": events,
+        "errors_encountered": errors_encountered
+    }
+
+def _co_create_instance(identifier: str) -> Dict[str, Any]:
+    """Synchronous CreateObject implementation; runs on the COM thread."""
     if not is_com_object_allowed(identifier):
         result = E_ACCESSDENIED
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: {identifier} is not on the ALLOWLIST",
+            "message": _MSG_ACCESS_DENIED + identifier + " is not on the ALLOWLIST",
             "runtime_id": None
         }
 
     try:
-        # Create the COM object using Dispatch, which internally calls CoCreateInstance
-        com_object = win32com.client.Dispatch(identifier)
+        # Create the COM object using Dispatch, which internally calls
+        # CoCreateInstance - or reuse a pooled instance for heavyweight
+        # application ProgIDs
+        com_object = _pooled_dispatch(identifier)
 
         # Generate a unique ID for this object instance
-        runtime_id = str(uuid.uuid4())
+        runtime_id = _new_runtime_id()
 
         # Determine if the identifier is a ProgID or CLSID
         # If it starts with { and ends with }, it's likely a CLSID
@@ -144,29 +433,22 @@ def co_create_instance(identifier: str) -> Dict[str, Any]:
         if is_clsid:
             clsid = identifier
             # Try to get ProgID from CLSID (may not always work)
-            try:
-                prog_id = win32com.client.ProgIDFromCLSID(identifier)
-            except:
-                prog_id = "Unknown"
+            prog_id = _progid_from_clsid(identifier)
         else:
             prog_id = identifier
             # Try to get CLSID from ProgID
-            try:
-                clsid = win32com.client.GetCLSIDFromProgID(identifier)
-            except:
-                clsid = "Unknown"
+            clsid = _clsid_from_progid(identifier)
 
         # Store the COM object and both identifiers in our registry
-        object_registry[runtime_id] = {
-            "object": com_object,
-            "prog_id": prog_id,
-            "clsid": clsid
-        }
+        global _reg_version
+        with _registry_lock:
+            object_registry[runtime_id] = _RegistryEntry(com_object, prog_id, clsid)
+            _reg_version += 1
 
         result = S_OK
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Successfully created COM object: {identifier}",
+            "message": _MSG_OK_CREATE + identifier,
             "runtime_id": runtime_id
         }
     except Exception as e:
@@ -177,44 +459,41 @@ def co_create_instance(identifier: str) -> Dict[str, Any]:
             "runtime_id": None
         }
 
-@mcp.tool("QueryInterface")
-def query_interface(runtime_id: str, iid: str) -> Dict[str, Any]:
+@mcp.tool("CreateObject")
+async def co_create_instance(identifier: str) -> Dict[str, Any]:
     """
-    Retrieves a pointer to a specified interface of a COM object and returns a new runtime ID.
+    This tool can be used to leverage Windows COM Automation to use Office applications, spreadsheets, 
+    emails, and anything else that is based on COM. It uses the win32com.client (python wrapper) module 
+    to create COM objects via a CLSID or ProgID (CoCreateInstance). 
+    The tool returns a unique runtime_id for the created object, which can be used to interact with it. 
+    For properties that are objects, a new runtime_id object is returned that you can use to interact. 
+    The same happens if an InvokeMethod returns a COM object, you can use the new runtime_id to interact with it.
     """
-    if runtime_id not in object_registry:
+    return await _run_on_com_thread(_co_create_instance, identifier)
+
+def _query_interface(runtime_id: str, iid: str) -> Dict[str, Any]:
+    """Synchronous QueryInterface implementation; runs on the COM thread."""
+    # Single .get() lookup - fetches the entry once instead of a membership
+    # test followed by a second hash lookup
+    entry = object_registry.get(runtime_id)
+    if entry is None:
         result = E_INVALIDARG
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}",
+            "message": _MSG_INVALID_ID + runtime_id,
             "runtime_id": None
         }
 
-    com_object = object_registry[runtime_id]["object"]
+    com_object = entry.obj
 
     try:
         interface = com_object.QueryInterface(iid)
-        new_runtime_id = str(uuid.uuid4())
-        # Try to get ProgID/CLSID for the new interface (may not always be possible)
-        prog_id = "Unknown"
-        clsid = "Unknown"
-        try:
-            clsid_bytes = interface._oleobj_.GetCLSID()
-            clsid = str(uuid.UUID(bytes_le=clsid_bytes))
-            prog_id = win32com.client.ProgIDFromCLSID(clsid)
-        except:
-            pass
-
-        object_registry[new_runtime_id] = {
-            "object": interface,
-            "prog_id": prog_id,
-            "clsid": clsid
-        }
+        new_runtime_id = _register_com_object(interface)
 
         result = S_OK
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Successfully queried interface: {iid}. New runtime ID: {new_runtime_id}",
+            "message": _MSG_OK_QUERY + iid + ". New runtime ID: " + new_runtime_id,
             "runtime_id": new_runtime_id
         }
     except Exception as e:
@@ -225,30 +504,37 @@ def query_interface(runtime_id: str, iid: str) -> Dict[str, Any]:
             "runtime_id": None
         }
 
-@mcp.tool("GetTypeInformation")
-def get_type_information(runtime_id: str) -> Dict[str, Any]:
+@mcp.tool("QueryInterface")
+async def query_interface(runtime_id: str, iid: str) -> Dict[str, Any]:
     """
-    Provides extended type information about a COM object.
-    Windows COM API equivalent: ITypeInfo::GetTypeAttr, ITypeInfo::GetDocumentation
+    Retrieves a pointer to a specified interface of a COM object and returns a new runtime ID.
     """
-    if runtime_id not in object_registry:
+    return await _run_on_com_thread(_query_interface, runtime_id, iid)
+
+def _get_type_information(runtime_id: str, refresh: bool = False) -> Dict[str, Any]:
+    """Synchronous GetTypeInformation implementation; runs on the COM thread."""
+    entry = object_registry.get(runtime_id)
+    if entry is None:
         result = E_INVALIDARG
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}",
+            "message": _MSG_INVALID_ID + runtime_id,
             "type_info": None
         }
 
-    com_object = object_registry[runtime_id]["object"]
+    com_object = entry.obj
 
     try:
-        # Get extended type information
-        type_info = get_type_info(com_object)
+        # Get extended type information (cached on first use)
+        type_info = entry.type_info
+        if type_info is None or refresh:
+            type_info = get_type_info(com_object)
+            entry.type_info = type_info
 
         result = S_OK
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Successfully retrieved type information",
+            "message": _MSG_OK_TYPE_INFO,
             "type_info": type_info
         }
     except Exception as e:
@@ -259,92 +545,68 @@ def get_type_information(runtime_id: str) -> Dict[str, Any]:
             "type_info": None
         }
 
-@mcp.tool("InvokeMethod")
-def invoke_method(runtime_id: str, method_name: str, args=None) -> Dict[str, Any]:
+@mcp.tool("GetTypeInformation")
+async def get_type_information(runtime_id: str, refresh: bool = False) -> Dict[str, Any]:
     """
-    Invokes a method on a previously registered COM object (runtime_id)
-    This function wraps the IDispatch::Invoke method.
-    Calling Conventions:
-    - Use Navigate2, instead of Navigate for IE.
-    - Instead of empty args (None), try using an empty list [] first.
+    Provides extended type information about a COM object.
+    The result is cached per object since introspecting a COM object is expensive
+    (every attribute access crosses the Python/COM boundary). Pass refresh=True to
+    force re-inspection. Windows COM API equivalent: ITypeInfo::GetTypeAttr, ITypeInfo::GetDocumentation
     """
-    if runtime_id not in object_registry:
+    return await _run_on_com_thread(_get_type_information, runtime_id, refresh)
+
+def _invoke_method(runtime_id: str, method_name: str, args=None) -> Dict[str, Any]:
+    """Synchronous InvokeMethod implementation; runs on the COM thread."""
+    entry = object_registry.get(runtime_id)
+    if entry is None:
         result = E_INVALIDARG
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}",
+            "message": _MSG_INVALID_ID + runtime_id,
             "return_value": None
         }
 
-    com_object = object_registry[runtime_id]["object"]
+    com_object = entry.obj
 
     try:
-        # Check if method exists
-        if not hasattr(com_object, method_name):
-            result = DISP_E_MEMBERNOTFOUND
-            return {
-                "result": result,
-                "message": f"{hr_to_string(result)}: Method not found: {method_name}",
-                "return_value": None
-            }
-
         # Fix for methods that require arguments but None is provided
         if args is None:
             args = []
 
         # Invoke the method
         try:
-            method = getattr(com_object, method_name)
+            # Resolve the method with a single getattr rather than a hasattr
+            # pre-check - for Dispatch objects every name lookup is a full
+            # IDispatch::GetIDsOfNames round-trip, so probing twice doubles
+            # the COM traffic
+            try:
+                method = getattr(com_object, method_name)
+            except AttributeError:
+                result = DISP_E_MEMBERNOTFOUND
+                return {
+                    "result": result,
+                    "message": _MSG_METHOD_NOT_FOUND + method_name,
+                    "return_value": None
+                }
             return_value = method(*args)
             result = S_OK
             
-            # Check if return value is a COM object by type
-            is_com_object = False
-            
-            # Check for common win32com class types
-            if (hasattr(return_value, "_oleobj_") or
-                type(return_value).__name__ == 'CDispatch' or 
-                'win32com' in str(type(return_value).__module__) or
-                '<COMObject' in str(return_value)):
-                is_com_object = True
-            
-            # Register if it's a COM object
-            if is_com_object:
-                new_runtime_id = str(uuid.uuid4())
-                clsid = "Unknown"
-                prog_id = "Unknown"
-                
-                # Try to get CLSID if possible (for informational purposes)
-                if hasattr(return_value, "_oleobj_"):
-                    try:
-                        clsid_bytes = return_value._oleobj_.GetCLSID()
-                        clsid = str(uuid.UUID(bytes_le=clsid_bytes))
-                        
-                        # Try to get ProgID
-                        try:
-                            prog_id = win32com.client.ProgIDFromCLSID(clsid)
-                        except Exception as e:
-                            logger.debug(f"Failed to get ProgID: {e}")
-                    except Exception as e:
-                        logger.debug(f"Failed to get CLSID: {e}")
-                
-                # Register the COM object
-                object_registry[new_runtime_id] = {
-                    "object": return_value,
-                    "prog_id": prog_id,
-                    "clsid": clsid
-                }
-                
+            # Register if the return value is itself a COM object - fetch
+            # _oleobj_ once and reuse it for detection and registration
+            oleobj = getattr(return_value, "_oleobj_", None)
+            if _is_com_object(return_value, oleobj):
+                new_runtime_id = _register_com_object(return_value, oleobj)
+
                 return {
                     "result": result,
-                    "message": f"{hr_to_string(result)}: Successfully invoked method: {method_name} and registered return value as COM object. Reference it with runtime_id: {new_runtime_id}",
+                    "message": _MSG_OK_INVOKE + method_name + " and registered return value as COM object. Reference it with runtime_id: " + new_runtime_id,
                     "return_value": new_runtime_id
                 }
             else:
                 # Not a COM object, return the value directly
                 return {
                     "result": result,
-                    "message": f"{hr_to_string(result)}: Successfully invoked method: {method_name}",
+                    "message": _MSG_OK_INVOKE + method_name,
                     "return_value": return_value
                 }
                 
@@ -363,88 +625,61 @@ def invoke_method(runtime_id: str, method_name: str, args=None) -> Dict[str, Any
             "return_value": None
         }
 
-@mcp.tool("GetProperty")
-def get_property(runtime_id: str, property_name: str) -> Dict[str, Any]:
+@mcp.tool("InvokeMethod")
+async def invoke_method(runtime_id: str, method_name: str, args=None) -> Dict[str, Any]:
     """
-    Gets a property value from a COM object. It attempts to register the returned object as a
-    COM object by checking its type. If this fails, it's treated as a regular property value.
-    Windows COM API equivalent: IDispatch::Invoke (DISPATCH_PROPERTYGET)
+    Invokes a method on a previously registered COM object (runtime_id)
+    This function wraps the IDispatch::Invoke method.
+    Calling Conventions:
+    - Use Navigate2, instead of Navigate for IE.
+    - Instead of empty args (None), try using an empty list [] first.
     """
-    if runtime_id not in object_registry:
+    return await _run_on_com_thread(_invoke_method, runtime_id, method_name, args)
+
+def _get_property(runtime_id: str, property_name: str) -> Dict[str, Any]:
+    """Synchronous GetProperty implementation; runs on the COM thread."""
+    entry = object_registry.get(runtime_id)
+    if entry is None:
         result = E_INVALIDARG
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}",
+            "message": _MSG_INVALID_ID + runtime_id,
             "value": None
         }
 
-    com_object = object_registry[runtime_id]["object"]
+    com_object = entry.obj
 
     try:
-        # Check if property exists
-        if not hasattr(com_object, property_name):
-            result = DISP_E_MEMBERNOTFOUND
-            return {
-                "result": result,
-                "message": f"{hr_to_string(result)}: Property not found: {property_name}",
-                "value": None
-            }
-
         try:
-            # Get the property value
-            value = getattr(com_object, property_name)
+            # Get the property value with a single getattr - a hasattr
+            # pre-check would cost a second IDispatch name lookup
+            try:
+                value = getattr(com_object, property_name)
+            except AttributeError:
+                result = DISP_E_MEMBERNOTFOUND
+                return {
+                    "result": result,
+                    "message": _MSG_PROPERTY_NOT_FOUND + property_name,
+                    "value": None
+                }
             result = S_OK
             
-            # Check if it's a COM object by type
-            # Import the specific types at the top of your file:
-            # from win32com.client import CDispatch, CoClassBaseClass, DispatchBaseClass
-            is_com_object = False
-            
-            # Check for common win32com class types
-            if (type(value).__name__ == 'CDispatch' or 
-                isinstance(value, (win32com.client.CDispatch, 
-                                  win32com.client.CoClassBaseClass,
-                                  win32com.client.DispatchBaseClass)) or
-                'win32com.gen_py' in str(type(value).__module__)):
-                is_com_object = True
-            
-            # Register if it's a COM object
-            if is_com_object:
-                new_runtime_id = str(uuid.uuid4())
-                clsid = "Unknown"
-                prog_id = "Unknown"
-                
-                # Try to get CLSID if possible (for informational purposes)
-                if hasattr(value, "_oleobj_"):
-                    try:
-                        clsid_bytes = value._oleobj_.GetCLSID()
-                        clsid = str(uuid.UUID(bytes_le=clsid_bytes))
-                        
-                        # Try to get ProgID
-                        try:
-                            prog_id = win32com.client.ProgIDFromCLSID(clsid)
-                        except Exception as e:
-                            logger.debug(f"Failed to get ProgID: {e}")
-                    except Exception as e:
-                        logger.debug(f"Failed to get CLSID: {e}")
-                
-                # Register the COM object
-                object_registry[new_runtime_id] = {
-                    "object": value,
-                    "prog_id": prog_id,
-                    "clsid": clsid
-                }
-                
+            # Register if the property value is itself a COM object - fetch
+            # _oleobj_ once and reuse it for detection and registration
+            oleobj = getattr(value, "_oleobj_", None)
+            if _is_com_object(value, oleobj):
+                new_runtime_id = _register_com_object(value, oleobj)
+
                 return {
                     "result": result,
-                    "message": f"{hr_to_string(result)}: Successfully got property: {property_name} and registered COM object. Reference it with runtime_id: {new_runtime_id}",
+                    "message": _MSG_OK_GET_PROPERTY + property_name + " and registered COM object. Reference it with runtime_id: " + new_runtime_id,
                     "value": new_runtime_id
                 }
             else:
                 # Not a COM object, return the value directly
                 return {
                     "result": result,
-                    "message": f"{hr_to_string(result)}: Successfully got property: {property_name}",
+                    "message": _MSG_OK_GET_PROPERTY + property_name,
                     "value": value
                 }
             
@@ -463,36 +698,47 @@ def get_property(runtime_id: str, property_name: str) -> Dict[str, Any]:
             "value": None
         }
 
-@mcp.tool("SetProperty")
-def set_property(runtime_id: str, property_name: str, value: Any) -> Dict[str, Any]:
+@mcp.tool("GetProperty")
+async def get_property(runtime_id: str, property_name: str) -> Dict[str, Any]:
     """
-    Sets a property value on a COM object.
-    Windows COM API equivalent: IDispatch::Invoke (DISPATCH_PROPERTYPUT)
+    Gets a property value from a COM object. It attempts to register the returned object as a
+    COM object by checking its type. If this fails, it's treated as a regular property value.
+    Windows COM API equivalent: IDispatch::Invoke (DISPATCH_PROPERTYGET)
     """
-    if runtime_id not in object_registry:
+    return await _run_on_com_thread(_get_property, runtime_id, property_name)
+
+def _set_property(runtime_id: str, property_name: str, value: Any) -> Dict[str, Any]:
+    """Synchronous SetProperty implementation; runs on the COM thread."""
+    entry = object_registry.get(runtime_id)
+    if entry is None:
         result = E_INVALIDARG
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}"
+            "message": _MSG_INVALID_ID + runtime_id
         }
 
-    com_object = object_registry[runtime_id]["object"]
+    com_object = entry.obj
 
     try:
-        # Set the property
-        if not hasattr(com_object, property_name):
+        # Set the property directly - a hasattr pre-check would cost a second
+        # IDispatch name lookup
+        try:
+            setattr(com_object, property_name, value)
+        except AttributeError:
             result = DISP_E_MEMBERNOTFOUND
             return {
                 "result": result,
-                "message": f"{hr_to_string(result)}: Property not found: {property_name}"
+                "message": _MSG_PROPERTY_NOT_FOUND + property_name
             }
 
-        setattr(com_object, property_name, value)
+        # Invalidate cached type information - the property change may alter
+        # the reported property types
+        entry.type_info = None
 
         result = S_OK
         return {
             "result": result,
-            "message": f"{hr_to_string(result)}: Successfully set property: {property_name}"
+            "message": _MSG_OK_SET_PROPERTY + property_name
         }
     except Exception as e:
         result = E_FAIL
@@ -501,58 +747,63 @@ def set_property(runtime_id: str, property_name: str, value: Any) -> Dict[str, A
             "message": f"{hr_to_string(result)}: Failed to set property: {str(e)}"
         }
 
-@mcp.tool("DisposeObject")
-def dispose_object(runtime_id_or_ids: Union[str, List[str]]) -> Dict[str, Any]:
+@mcp.tool("SetProperty")
+async def set_property(runtime_id: str, property_name: str, value: Any) -> Dict[str, Any]:
     """
-    Disposes one or more COM objects and removes them from the registry.
-    Typically only dispose of objects if the user wants to close a specific application or interaction,
-    otherwise keep things around. Windows COM API equivalent: IUnknown::Release
-    
-    Args:
-        runtime_id_or_ids: Either a single runtime_id string or a list of runtime_id strings
-        
-    Returns:
-        A dictionary containing result code and status message
+    Sets a property value on a COM object.
+    Windows COM API equivalent: IDispatch::Invoke (DISPATCH_PROPERTYPUT)
     """
+    return await _run_on_com_thread(_set_property, runtime_id, property_name, value)
+
+def _dispose_object(runtime_id_or_ids: Union[str, List[str]]) -> Dict[str, Any]:
+    """Synchronous DisposeObject implementation; runs on the COM thread."""
     # Handle single ID case
     if isinstance(runtime_id_or_ids, str):
         runtime_id_or_ids = [runtime_id_or_ids]
-    
-    # Track results for each object
-    results = []
+
+    # Track results for each object - preallocated since the size is known
+    results: List[Optional[Dict[str, Any]]] = [None] * len(runtime_id_or_ids)
     overall_result = S_OK
-    
-    # Process each object ID
-    for runtime_id in runtime_id_or_ids:
-        if runtime_id not in object_registry:
-            result = E_INVALIDARG
-            results.append({
-                "id": runtime_id,
-                "result": result,
-                "message": f"{hr_to_string(result)}: Invalid object ID: {runtime_id}"
-            })
+
+    # For large batches, collapse the invalid IDs into one summary entry to
+    # bound the response size
+    summarize_invalid = len(runtime_id_or_ids) > _DISPOSE_SUMMARY_THRESHOLD
+    invalid_ids: List[str] = []
+
+    # Process each object ID - a single pop() both checks and removes the
+    # entry; Python's garbage collection will handle COM reference counting
+    global _reg_version
+    for index, runtime_id in enumerate(runtime_id_or_ids):
+        with _registry_lock:
+            entry = object_registry.pop(runtime_id, _MISSING)
+            if entry is not _MISSING:
+                _reg_version += 1
+        if entry is _MISSING:
             overall_result = E_FAIL
-            continue
-            
-        try:
-            # Remove the object from the registry
-            # Python's garbage collection will handle COM reference counting
-            del object_registry[runtime_id]
-            result = S_OK
-            results.append({
-                "id": runtime_id,
-                "result": result,
-                "message": f"{hr_to_string(result)}: Successfully disposed object"
-            })
-        except Exception as e:
-            result = E_FAIL
-            results.append({
+            if summarize_invalid:
+                invalid_ids.append(runtime_id)
+            else:
+                results[index] = {
+                    "id": runtime_id,
+                    "result": E_INVALIDARG,
+                    "message": _MSG_INVALID_ID + runtime_id
+                }
+        else:
+            _maybe_pool_object(entry)
+            results[index] = {
                 "id": runtime_id,
-                "result": result,
-                "message": f"{hr_to_string(result)}: Failed to dispose object: {str(e)}"
-            })
-            overall_result = E_FAIL
-    
+                "result": S_OK,
+                "message": _MSG_OK_DISPOSE
+            }
+
+    if invalid_ids:
+        results = [entry for entry in results if entry is not None]
+        results.append({
+            "id": None,
+            "result": E_INVALIDARG,
+            "message": _MSG_INVALID_ID + ", ".join(invalid_ids)
+        })
+
     # Return aggregated results
     return {
         "result": overall_result,
@@ -560,6 +811,20 @@ def dispose_object(runtime_id_or_ids: Union[str, List[str]]) -> Dict[str, Any]:
         "details": results
     }
 
+@mcp.tool("DisposeObject")
+async def dispose_object(runtime_id_or_ids: Union[str, List[str]]) -> Dict[str, Any]:
+    """
+    Disposes one or more COM objects and removes them from the registry.
+    Typically only dispose of objects if the user wants to close a specific application or interaction,
+    otherwise keep things around. Windows COM API equivalent: IUnknown::Release
+    
+    Args:
+        runtime_id_or_ids: Either a single runtime_id string or a list of runtime_id strings
+        
+    Returns:
+        A dictionary containing result code and status message
+    """
+    return await _run_on_com_thread(_dispose_object, runtime_id_or_ids)
 
 @mcp.tool("ListActiveComObjects")
 def list_active_com_objects() -> Dict[str, Any]:
@@ -568,20 +833,36 @@ def list_active_com_objects() -> Dict[str, Any]:
     Windows COM API equivalent: Closest equivalent is EnumRunning from the Running Object Table (ROT).
     Output Format: Print the result formatted as a table.
     """
+    global _list_cache
+
+    # Snapshot the registry and its version together under the lock -
+    # mutations happen on the COM executor thread, and iterating the live
+    # dict while it resizes would raise RuntimeError
+    with _registry_lock:
+        version = _reg_version
+        # Reuse the previous response while the registry is unchanged -
+        # agents tend to poll this tool in inspection loops
+        response, cached_version = _list_cache
+        if cached_version == version:
+            return response
+        entries = list(object_registry.items())
+
     objects = []
-    for obj_id, obj_data in object_registry.items():
+    for obj_id, obj_data in entries:
         objects.append({
             "runtime_id": obj_id,
-            "prog_id": obj_data["prog_id"],  # Use the stored ProgID
-            "clsid": obj_data.get("clsid", "Unknown")  # Get CLSID if available
+            "prog_id": obj_data.prog_id,  # Use the stored ProgID
+            "clsid": obj_data.clsid  # CLSID defaults to "Unknown" at registration
         })
 
     result = S_OK
-    return {
+    response = {
         "result": result,
         "message": f"{hr_to_string(result)}: Found {len(objects)} active COM objects",
         "objects": objects
     }
+    _list_cache = (response, version)
+    return response
 
 @mcp.resource("mcp-com://demos/sapi-greeting")
 def res_greeting() -> str:
@@ -602,5 +883,7 @@ if __name__ == "__main__":
     try:
         mcp.run(transport="stdio")
     except Exception as e:
-        logger.error(f"mcp-com-server error: {str(e)}")
-        sys.exit(1) 
\ No newline at end of file
+        logger.error("mcp-com-server error: %s", e)
+        sys.exit(1)
+    finally:
+        _shutdown_com_executor() 
\ No newline at end of file